@@ -1,7 +1,10 @@
+import csv
+import math
+import os
+import threading
 import streamlit as st
-import pandas as pd
+from streamlit.runtime.scriptrunner import add_script_run_ctx
 import numpy as np
-import joblib
 
 # Set page configuration
 st.set_page_config(
@@ -10,49 +13,106 @@ st.set_page_config(
     layout="wide"
 )
 
-# Load the model and scaler
+# Load the ONNX export of the model (see export_onnx.py) if it is available
+def load_onnx_session():
+    if not os.path.exists('smartphone_price_prediction_model.onnx'):
+        return None
+    import onnxruntime as ort
+    return ort.InferenceSession(
+        'smartphone_price_prediction_model.onnx',
+        providers=['CPUExecutionProvider']
+    )
+
+# Load the model and bind the matching predict function once:
+# (1, 7) float32 row -> price in Rupiah as a float, whichever backend serves it
 @st.cache_resource
 def load_model():
+    session = load_onnx_session()
+    if session is not None:
+        # Scaler is fused into the ONNX graph, so the raw features go in as-is
+        return lambda arr: math.expm1(float(session.run(None, {'input': arr})[0].ravel()[0]))
+    
+    # Heavy imports are deferred so the first page render does not pay for them
+    import joblib
     try:
-        model = joblib.load('smartphone_price_prediction_model.pkl')
-        scaler = joblib.load('smartphone_price_scaler.pkl')
-        return model, scaler
+        model = joblib.load('smartphone_price_prediction_model.pkl', mmap_mode='r')
+        scaler = joblib.load('smartphone_price_scaler.pkl', mmap_mode='r')
     except FileNotFoundError:
         st.error("❌ Model files not found. Please make sure the model has been trained and saved.")
-        return None, None
+        return None
+    
+    # Linear models were trained on scaled features; fold the scaler into the
+    # weights. float32 matches the ONNX input; tests/test_predict_kernels.py checks
+    # the prices against the float64 sklearn path.
+    if hasattr(model, 'coef_'):
+        # Scaling dan log transformasi sudah digabung di kernel linear
+        from predict_kernels import fuse_scaler, predict_idr
+        w_eff, b_eff = fuse_scaler(model, scaler)
+        return lambda arr: float(predict_idr(arr[0], w_eff, b_eff))
+    
+    # Model pohon dilatih tanpa scaling; kembalikan dari log transformasi
+    return lambda arr: math.expm1(float(model.predict(arr)[0]))
 
-# Load brand mapping
+# Load brand mapping (Brand -> BrandID, in file order)
 @st.cache_data
 def load_brand_mapping():
     try:
-        brand_df = pd.read_csv('brand_mapping.csv')
-        return brand_df
+        with open('brand_mapping.csv', newline='', encoding='utf-8') as f:
+            reader = csv.reader(f)
+            next(reader)  # header: Brand,BrandID
+            brand_to_id = {brand: int(brand_id) for brand, brand_id in reader}
     except FileNotFoundError:
         st.error("❌ Brand mapping file not found.")
-        return pd.DataFrame({'Brand': ['Unknown'], 'BrandID': [0]})
+        brand_to_id = {'Unknown': 0}
+    return list(brand_to_id), brand_to_id
 
-# Load the model and brand mapping
-model, scaler = load_model()
-brand_df = load_brand_mapping()
+# Brand mapping is needed to render the form; the model is loaded lazily
+# on the first prediction so the page can render without waiting for it
+brand_names, brand_to_id = load_brand_mapping()
 
 # Function to make predictions
+# features: (RAM, Storage, Camera, ScreenSize, Battery, ReleaseYear, BrandID),
+# in the same column order the model was trained on
 def predict_price(features):
-    input_df = pd.DataFrame([features])
-    
-    if model is None or scaler is None:
+    predict_fn = load_model()
+    if predict_fn is None:
         return None
     
-    # Lakukan scaling jika diperlukan
-    if hasattr(model, 'coef_'):
-        input_scaled = scaler.transform(input_df)
-        prediction = model.predict(input_scaled)[0]
-    else:
-        prediction = model.predict(input_df)[0]
-    
-    # Kembalikan dari log transformasi
-    prediction = np.expm1(prediction)
-    
-    return prediction
+    input_arr = np.empty((1, 7), dtype=np.float32)
+    input_arr[0, :] = features
+    return predict_fn(input_arr)
+
+# Warm up in the background: load the model, init the ONNX session and
+# compile the numba kernel while the user is still filling in the form.
+# cache_resource makes this run once per process, and load_model's cache
+# lock makes the first real click wait for (not repeat) this work.
+# The thread gets the session's script context, so load_model's st.error
+# (e.g. missing model files) still reaches the page.
+@st.cache_resource
+def start_warm_up():
+    thread = threading.Thread(
+        target=predict_price,
+        args=((8, 128, 64, 6.5, 5000, 2023, 0),),
+        daemon=True
+    )
+    add_script_run_ctx(thread)
+    thread.start()
+    return thread
+
+start_warm_up()
+
+# Result card shown after a prediction
+_RESULT_TMPL = """
+### **📢 Prediction for a {brand} phone**
+- **RAM**: {ram}GB  
+- **Storage**: {storage}GB  
+- **Camera**: {camera}MP  
+- **Screen Size**: {screen_size} inches  
+- **Battery**: {battery}mAh  
+- **Release Year**: {release_year}
+
+### 💰 **Predicted Price: Rp {price:,}**
+"""
 
 # Main app layout
 st.title("📱 Smartphone Price Predictor")
@@ -73,46 +133,39 @@ col1, col2 = st.columns([2, 3])
 with col1:
     st.header("🛠 Masukkan Spesifikasi Smartphone")
     
-    brand = st.selectbox("📌 Brand", options=brand_df['Brand'].tolist(), index=2)
-    brand_id = brand_df[brand_df['Brand'] == brand]['BrandID'].values[0]
-    
-    ram = st.slider("💾 RAM (GB)", 1, 24, 8, 1)
-    storage = st.slider("💾 Storage (GB)", 1, 512, 128, 1)
-    camera = st.slider("📷 Main Camera (MP)", 1, 200, 64, 1)
-    screen_size = st.slider("📱 Screen Size (inches)", 4.0, 8.0, 6.5, 0.1)
-    battery = st.slider("🔋 Battery Capacity (mAh)", 1000, 10000, 5000, 100)
-    release_year = st.slider("📆 Release Year", 2015, 2025, 2023, 1)
-    
-    predict_button = st.button("🔮 Predict Price")
+    # Widgets inside a form only trigger a rerun on submit, not on every slider tick
+    with st.form("specs"):
+        brand = st.selectbox("📌 Brand", options=brand_names, index=2)
+        
+        ram = st.slider("💾 RAM (GB)", 1, 24, 8, 1)
+        storage = st.slider("💾 Storage (GB)", 1, 512, 128, 1)
+        camera = st.slider("📷 Main Camera (MP)", 1, 200, 64, 1)
+        screen_size = st.slider("📱 Screen Size (inches)", 4.0, 8.0, 6.5, 0.1)
+        battery = st.slider("🔋 Battery Capacity (mAh)", 1000, 10000, 5000, 100)
+        release_year = st.slider("📆 Release Year", 2015, 2025, 2023, 1)
+        
+        predict_button = st.form_submit_button("🔮 Predict Price")
 
 with col2:
     st.header("📊 Hasil Prediksi")
     
     if predict_button:
-        features = {
-            'RAM': float(ram),
-            'Storage': float(storage),
-            'Camera': float(camera),
-            'ScreenSize': float(screen_size),
-            'Battery': float(battery),
-            'ReleaseYear': float(release_year),
-            'BrandID': float(brand_id)
-        }
+        brand_id = brand_to_id[brand]
+        features = (ram, storage, camera, screen_size, battery, release_year, brand_id)
         
         prediction = predict_price(features)
         
         if prediction is not None:
-            st.markdown(f"""
-            ### **📢 Prediction for a {brand} phone**
-            - **RAM**: {int(ram)}GB  
-            - **Storage**: {int(storage)}GB  
-            - **Camera**: {int(camera)}MP  
-            - **Screen Size**: {screen_size} inches  
-            - **Battery**: {int(battery)}mAh  
-            - **Release Year**: {int(release_year)}
-            
-            ### 💰 **Predicted Price: Rp {int(prediction):,}**
-            """, unsafe_allow_html=True)
+            st.markdown(_RESULT_TMPL.format(
+                brand=brand,
+                ram=int(ram),
+                storage=int(storage),
+                camera=int(camera),
+                screen_size=screen_size,
+                battery=int(battery),
+                release_year=int(release_year),
+                price=int(prediction)
+            ), unsafe_allow_html=True)
         else:
             st.error("❌ Model or scaler is not loaded correctly.")
     
@@ -0,0 +1 @@
+# Lets the tests under tests/ import the top-level modules (predict_kernels, ...)
@@ -0,0 +1,32 @@
+import joblib
+from sklearn.pipeline import make_pipeline
+from skl2onnx import convert_sklearn
+from skl2onnx.common.data_types import FloatTensorType
+
+MODEL_PATH = 'smartphone_price_prediction_model.pkl'
+SCALER_PATH = 'smartphone_price_scaler.pkl'
+ONNX_MODEL_PATH = 'smartphone_price_prediction_model.onnx'
+
+# RAM, Storage, Camera, ScreenSize, Battery, ReleaseYear, BrandID
+N_FEATURES = 7
+
+def main():
+    model = joblib.load(MODEL_PATH)
+    scaler = joblib.load(SCALER_PATH)
+
+    # Linear models were trained on scaled features, tree models on raw ones.
+    # Fuse the scaler into the graph so the app only runs a single session.
+    if hasattr(model, 'coef_'):
+        model = make_pipeline(scaler, model)
+
+    onnx_model = convert_sklearn(
+        model,
+        initial_types=[('input', FloatTensorType([None, N_FEATURES]))]
+    )
+
+    with open(ONNX_MODEL_PATH, 'wb') as f:
+        f.write(onnx_model.SerializeToString())
+    print(f"ONNX model saved as '{ONNX_MODEL_PATH}'")
+
+if __name__ == "__main__":
+    main()
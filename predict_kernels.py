@@ -0,0 +1,32 @@
+import math
+import numpy as np
+from numba import njit
+
+# Kept out of app.py on purpose: Streamlit re-executes the app script on
+# every rerun, which would re-create (and re-load) the jitted dispatchers.
+# Imported modules are cached, so these are compiled once per process.
+
+def fuse_scaler(model, scaler):
+    """Fold a StandardScaler into a linear model's weights, as float32 (w_eff, b_eff).
+    
+    coef · (x - mean) / scale + intercept == (coef / scale) · x + b_eff
+    """
+    w_eff = model.coef_ / scaler.scale_
+    b_eff = model.intercept_ - w_eff @ scaler.mean_
+    return w_eff.astype(np.float32), np.float32(b_eff)
+
+@njit(cache=True, fastmath=True)
+def predict_idr(x, w, b):
+    """Fused linear predictor: expm1(w·x + b) on a single feature row, as whole Rupiah"""
+    acc = 0.0
+    for i in range(x.shape[0]):
+        acc += x[i] * w[i]
+    return np.int64(math.expm1(acc + b))
+
+@njit(cache=True, fastmath=True)
+def predict_idr_batch(X, w, b):
+    """Batched predict_idr: one whole-Rupiah price per feature row of X"""
+    out = np.empty(X.shape[0], dtype=np.int64)
+    for r in range(X.shape[0]):
+        out[r] = predict_idr(X[r], w, b)
+    return out
@@ -0,0 +1,35 @@
+import math
+import numpy as np
+from numba import njit
+
+# Summary-statistics kernels for web_scrape.py's end-of-scrape report.
+# No fastmath here: it lets LLVM assume there are no NaNs, which would
+# optimise away the missing-value checks these kernels depend on.
+
+@njit(cache=True)
+def column_stats(a):
+    """Fused single pass over a float column: (count, mean, std, min, max, nan_count), std with ddof=1"""
+    n = 0
+    s = 0.0
+    ss = 0.0
+    mn = np.inf
+    mx = -np.inf
+    nan_count = 0
+    for i in range(a.shape[0]):
+        v = a[i]
+        if np.isnan(v):
+            nan_count += 1
+            continue
+        n += 1
+        s += v
+        ss += v * v
+        if v < mn:
+            mn = v
+        if v > mx:
+            mx = v
+    
+    if n == 0:
+        return 0, np.nan, np.nan, np.nan, np.nan, nan_count
+    mean = s / n
+    std = math.sqrt(max(ss - s * mean, 0.0) / (n - 1)) if n > 1 else np.nan
+    return n, mean, std, mn, mx, nan_count
@@ -0,0 +1,47 @@
+import os
+import numpy as np
+import pytest
+
+pd = pytest.importorskip('pandas')
+pytest.importorskip('numba')
+preprocessing = pytest.importorskip('sklearn.preprocessing')
+linear_model = pytest.importorskip('sklearn.linear_model')
+
+from predict_kernels import fuse_scaler, predict_idr, predict_idr_batch
+
+DATA_PATH = os.path.join(os.path.dirname(__file__), '..', 'smartphone_data_model_ready.csv')
+
+# RAM, Storage, Camera, ScreenSize, Battery, ReleaseYear, BrandID
+FEATURES = ['RAM', 'Storage', 'Camera', 'ScreenSize', 'Battery', 'ReleaseYear', 'BrandID']
+
+# Largest accepted relative difference between the float32 kernel and the
+# float64 sklearn path (0.05%, i.e. 500 Rupiah on a 1,000,000 price)
+MAX_RELATIVE_ERROR = 5e-4
+
+@pytest.fixture(scope='module')
+def fitted_linear():
+    """A scaler + linear model fitted on the real data, like the training notebook does for linear models"""
+    data = pd.read_csv(DATA_PATH).dropna(subset=FEATURES + ['Price'])
+    X = data[FEATURES].to_numpy(dtype=np.float64)
+    y = np.log1p(data['Price'].to_numpy(dtype=np.float64))
+    scaler = preprocessing.StandardScaler().fit(X)
+    model = linear_model.LinearRegression().fit(scaler.transform(X), y)
+    return model, scaler, X
+
+def test_float32_kernel_matches_float64_path(fitted_linear):
+    model, scaler, X = fitted_linear
+    expected = np.expm1(model.predict(scaler.transform(X)))
+    
+    w_eff, b_eff = fuse_scaler(model, scaler)
+    actual = predict_idr_batch(X.astype(np.float32), w_eff, b_eff)
+    
+    rel_error = np.abs(actual - expected) / np.abs(expected)
+    assert rel_error.max() <= MAX_RELATIVE_ERROR
+
+def test_single_row_kernel_matches_batch(fitted_linear):
+    model, scaler, X = fitted_linear
+    w_eff, b_eff = fuse_scaler(model, scaler)
+    X32 = X[:20].astype(np.float32)
+    
+    batch = predict_idr_batch(X32, w_eff, b_eff)
+    assert [predict_idr(row, w_eff, b_eff) for row in X32] == list(batch)
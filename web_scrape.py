@@ -1,13 +1,17 @@
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 import pandas as pd
 import re
+import hashlib
 import time
-import random
 import os
+import csv
 import shutil
 import logging
-from datetime import datetime
+import threading
+from collections import deque, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from requests.adapters import HTTPAdapter
 from requests.packages.urllib3.util.retry import Retry
 
@@ -22,23 +26,100 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Precompiled patterns for the per-product extraction hot path
+YEAR_RE = re.compile(r'\b(20\d{2})\b')  # Years 2000-2099
+ROM_NAME_RE = re.compile(r'ROM\s*(\d+)\s*GB')
+RAM_NAME_RE = re.compile(r'RAM\s*(\d+)\s*GB')
+RAM_NAME_DECIMAL_RE = re.compile(r'RAM\s*(\d+(?:\.\d+)?)\s*GB')  # Newest layout names, e.g. 'RAM 1.5GB'
+PRICE_RE = re.compile(r'Rp\s*([\d\.]+)')
+RP_TEXT_RE = re.compile('Rp')  # Text nodes that may hold a price
+PRICE_TRANS = str.maketrans('', '', 'Rp.')
+
+# The GB, MP, inch and mAh patterns in one alternation, so a piece of spec text
+# is scanned once. Each is a number right before its unit, so no match can
+# overlap another and the first match per group is that pattern's first match.
+SPEC_RE = re.compile(r'(?P<gb>\d+)\s*GB|(?P<mp>\d+)\s*MP|(?P<inch>[\d.]+)\s*inch|(?P<mah>\d+)\s*mAh')
+
+# Column order of the scraped CSV
+CSV_FIELDNAMES = ['Name', 'Price', 'RAM', 'Storage', 'Camera', 'ScreenSize', 'Battery', 'ReleaseYear']
+
+# One scraped phone, as a fixed tuple in CSV column order
+PhoneRecord = namedtuple('PhoneRecord', CSV_FIELDNAMES)
+
+# Nullable dtypes for reading the CSV back; missing values stay <NA> instead of
+# turning integer columns into float/object. RAM can be fractional (1.5 GB).
+CSV_DTYPES = {
+    'Price': 'Int64',
+    'RAM': 'Float32',
+    'Storage': 'Int16',
+    'Camera': 'Int16',
+    'ScreenSize': 'Float32',
+    'Battery': 'Int32',
+    'ReleaseYear': 'Int16'
+}
+# The same column types for pyarrow, applied after reading the columns as float64
+ARROW_COLUMN_TYPES = {
+    'Price': 'int64',
+    'RAM': 'float32',
+    'Storage': 'int16',
+    'Camera': 'int16',
+    'ScreenSize': 'float32',
+    'Battery': 'int32',
+    'ReleaseYear': 'int16'
+}
+
+# Below this many rows (e.g. a short test run) the summary report just lists
+# the rows, since quartiles and null counts of a handful of phones say little
+SMALL_SUMMARY_ROWS = 16
+
+# Six significant digits, like the default DataFrame display
+SUMMARY_FLOAT_FORMAT = '%.6g'
+
+# Write buffer for the summary report, comfortably larger than the report itself
+SUMMARY_BUFFER_SIZE = 1 << 20
+
+# Class-name filters; bs4 searches these against each class directly instead
+# of calling back into a Python lambda for every tag
+NAME_CLASS_RE = re.compile(r'name|title', re.I)
+PRODUCT_ITEM_CLASS_RE = re.compile(r'product|item', re.I)
+PRODUCT_CLASS_RE = re.compile(r'product|item|card|listing', re.I)
+
+# CSS selectors for class/href substring lookups inside a product
+SPEC_DIV_SELECTOR = 'div[class*="spec" i], div[class*="detail" i]'
+SPEC_ITEM_SELECTOR = 'div[class*="col-md-6"], div[class*="spec" i]'
+PRICE_CLASS_SELECTOR = '[class*="price" i]'
+SELLER_LINK_SELECTOR = 'a[href*="track/seller"]'
+
+# Product containers that confirm a page-number layout guess. Generic 'row'
+# divs are left out on purpose: they show up on other layouts as well.
+LAYOUT_CONTAINER_SELECTORS = {
+    'old': 'div.styles_productPanel__Tlvp6',
+    'new': 'div[class*="productPanel"]'
+}
+
+# Only build the parts of the page the extractors look at. Every layout keys
+# off div product panels, h2 headers or the links after them, so <head>,
+# scripts, styles and other top-level markup are skipped while parsing.
+PAGE_STRAINER = SoupStrainer(['div', 'h2', 'a'])
+
 def clean_price(price_text):
     """Clean price text to extract only the numeric value"""
     if not price_text:
         return None
-    # Remove 'Rp' and replace dots with empty string (Indonesian format uses dots as thousand separators)
-    price = price_text.replace('Rp', '').replace('.', '').strip()
+    # Drop the 'Rp' letters and the dots (Indonesian format uses dots as thousand
+    # separators) in one pass. Whitespace is kept: int() ignores it at the edges,
+    # and inside it keeps two prices in one text from fusing into one number.
     try:
-        return int(price)
+        return int(price_text.translate(PRICE_TRANS))
     except (ValueError, TypeError):
         return None
 
 def extract_spec_value(text, pattern, unit=''):
-    """Extract numeric value from specification text"""
+    """Extract numeric value from specification text using a compiled pattern"""
     if not text:
         return None
     
-    match = re.search(pattern, text)
+    match = pattern.search(text)
     if match:
         try:
             return float(match.group(1).strip()) if '.' in match.group(1) else int(match.group(1).strip())
@@ -46,6 +127,66 @@ def extract_spec_value(text, pattern, unit=''):
             return None
     return None
 
+def scan_spec_text(text):
+    """Find the first GB, MP, inch and mAh value in a piece of spec text with a single regex pass"""
+    found = {}
+    for match in SPEC_RE.finditer(text):
+        group = match.lastgroup
+        if group not in found:
+            found[group] = match.group(group)
+            if len(found) == 4:
+                break
+    return found
+
+def parse_specs(spec_texts):
+    """Extract RAM, storage, camera, screen size and battery from a product's spec items.
+    
+    Each item's text is scanned on its own, so a number in one item is never
+    paired with a label from the next.
+    """
+    specs = {'RAM': None, 'Storage': None, 'Camera': None, 'ScreenSize': None, 'Battery': None}
+    
+    for spec_text in spec_texts:
+        found = scan_spec_text(spec_text)
+        
+        gb_value = found.get('gb')
+        if gb_value is not None:
+            upper_text = spec_text.upper()
+            # Check for RAM
+            if 'RAM' in upper_text or specs['RAM'] is None:
+                specs['RAM'] = int(gb_value)
+            # Check for storage; make sure it's not RAM
+            if 'RAM' not in upper_text and ('ROM' in upper_text or 'STORAGE' in upper_text or specs['Storage'] is None):
+                specs['Storage'] = int(gb_value)
+        
+        if specs['Camera'] is None and 'mp' in found:
+            specs['Camera'] = int(found['mp'])
+        
+        if specs['ScreenSize'] is None and 'inch' in found:
+            try:
+                specs['ScreenSize'] = float(found['inch'])
+            except ValueError:
+                pass
+        
+        if specs['Battery'] is None and 'mah' in found:
+            specs['Battery'] = int(found['mah'])
+    
+    return specs
+
+# ioctl request number for a copy-on-write file clone (FICLONE in linux/fs.h)
+FICLONE = 0x40049409
+
+def clone_file(src, dst):
+    """Clone src to dst as a copy-on-write reflink; returns False if the platform or filesystem can't"""
+    try:
+        import fcntl
+        with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+            fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+        shutil.copystat(src, dst)
+        return True
+    except (ImportError, OSError):
+        return False
+
 def create_backup(file_path):
     """Create a backup of the specified file"""
     if os.path.exists(file_path):
@@ -55,57 +196,67 @@ def create_backup(file_path):
             os.makedirs(backup_dir)
         
         # Generate backup filename with timestamp
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
         file_name = os.path.basename(file_path)
         backup_name = f"{os.path.splitext(file_name)[0]}_{timestamp}{os.path.splitext(file_name)[1]}"
         backup_path = os.path.join(backup_dir, backup_name)
         
-        # Copy the file to backup
-        shutil.copy2(file_path, backup_path)
+        # Reflink the file where supported (constant time, still a real snapshot),
+        # otherwise copy it
+        if not clone_file(file_path, backup_path):
+            shutil.copy2(file_path, backup_path)
         logger.info(f"Backup created: {backup_path}")
         return backup_path
     return None
 
-def save_data_to_csv(data, csv_filename, append=False):
-    """Save data to CSV file, with option to append"""
-    # Check if file exists to determine if we need to append
-    file_exists = os.path.exists(csv_filename)
-    
-    # If file exists and we're not in append mode, create a backup
-    if file_exists and not append:
-        create_backup(csv_filename)
-    
-    mode = 'a' if append and file_exists else 'w'
-    header = not (append and file_exists)
-    
-    # Create a DataFrame
-    df = pd.DataFrame(data)
-    
-    # Save to CSV
-    df.to_csv(csv_filename, mode=mode, header=header, index=False, encoding="utf-8")
-    logger.info(f"Data {'appended to' if append and file_exists else 'saved to'} {csv_filename}")
-    
-    return df
+def phone_key(name):
+    """Fixed-size (8-byte) dedupe key for a phone name"""
+    return hashlib.blake2b(name.encode('utf-8'), digest_size=8).digest()
 
 def get_existing_phones(csv_filename):
-    """Get list of phone names already in the CSV to avoid duplicates"""
+    """Get the keys of phone names already in the CSV to avoid duplicates"""
     if os.path.exists(csv_filename):
         try:
-            df = pd.read_csv(csv_filename)
-            if 'Name' in df.columns:
-                return set(df['Name'].tolist())
+            # Only the Name column is needed, so stream rows instead of loading a DataFrame
+            with open(csv_filename, newline='', encoding='utf-8') as f:
+                reader = csv.reader(f)
+                header = next(reader, [])
+                if 'Name' in header:
+                    name_idx = header.index('Name')
+                    return {phone_key(row[name_idx]) for row in reader if len(row) > name_idx}
         except Exception as e:
             logger.error(f"Error reading existing CSV: {e}")
     return set()
 
 def detect_layout(soup, page_number):
+    """Guess the layout type from the page number, confirming the guess with one selector lookup.
+    
+    Falls back to the full probe_layout when the guessed layout's product
+    container is not on the page.
+    """
+    # Newest layout (page 269+): stop at the first h2 with RAM and ROM in it
+    if page_number >= 269:
+        for header in soup.find_all('h2'):
+            header_text = header.get_text()
+            if "RAM" in header_text and "ROM" in header_text:
+                return "newest"
+    
+    # Old layout for pages 1-201 and new layout for 202+, if its product panels are there
+    guessed_layout = "new" if page_number >= 202 else "old"
+    if soup.select_one(LAYOUT_CONTAINER_SELECTORS[guessed_layout]):
+        return guessed_layout
+    
+    return probe_layout(soup, page_number)
+
+def probe_layout(soup, page_number):
     """Detect the layout type based on page content and page number"""
     # Check for the newest layout first (seen on page 269+)
     # This layout has h2 headers with phone names and links with specs
     h2_headers = soup.find_all('h2')
     if h2_headers and len(h2_headers) > 5:  # Multiple h2 headers is a strong indicator
         for header in h2_headers:
-            if "RAM" in header.text and "ROM" in header.text:
+            header_text = header.get_text()
+            if "RAM" in header_text and "ROM" in header_text:
                 return "newest"
     
     # Default to old layout for pages 1-201 and new layout for 202+
@@ -147,12 +298,18 @@ def extract_product_data_new_layout(product):
             # Try alternative selectors for product name
             name_element = product.find('h2')
             if not name_element:
-                name_element = product.find(['h2', 'h3', 'div'], class_=lambda c: c and ('name' in c.lower() or 'title' in c.lower()))
+                name_element = product.find(['h2', 'h3', 'div'], class_=NAME_CLASS_RE)
         
         if not name_element:
             return None
             
-        name = name_element.text.strip()
+        name = name_element.get_text().strip()
+        
+        # Flatten the product's text once for the year fallback and the 'Rp' check
+        product_text = product.get_text(" ", strip=True)
+        # Every price method looks for 'Rp' in some part of the product, so
+        # without it anywhere the element lookups can be skipped
+        has_price = 'Rp' in product_text
         
         # Extract release year
         release_year = None
@@ -161,38 +318,32 @@ def extract_product_data_new_layout(product):
             year_span = year_div.find('span')
             if year_span:
                 try:
-                    release_year = int(year_span.text.strip())
+                    release_year = int(year_span.get_text().strip())
                 except (ValueError, TypeError):
                     pass
         
-        # If year not found in the specific div, try to find it in any text containing a 4-digit year
+        # If year not found in the specific div, take the first 4-digit year in the product text
         if not release_year:
-            year_pattern = r'\b(20\d{2})\b'  # Pattern for years 2000-2099
-            for element in product.find_all(text=True):
-                match = re.search(year_pattern, element.strip())
-                if match:
-                    try:
-                        release_year = int(match.group(1))
-                        break
-                    except (ValueError, TypeError):
-                        pass
+            year_match = YEAR_RE.search(product_text)
+            if year_match:
+                release_year = int(year_match.group(1))
         
         # Extract price - try multiple approaches for the new layout
         price = None
         
-        # Method 1: Look for price in any text containing 'Rp'
-        for element in product.find_all(text=lambda text: text and 'Rp' in text):
-            price_text = element.strip()
-            price = clean_price(price_text)
-            if price:
-                break
+        # Method 1: Look for price in any text node containing 'Rp'
+        if has_price:
+            for element in product.find_all(string=RP_TEXT_RE):
+                price = clean_price(element.strip())
+                if price:
+                    break
         
         # Method 2: Look for elements with class containing 'price'
-        if price is None:
-            price_elements = product.find_all(class_=lambda c: c and 'price' in c.lower())
-            for element in price_elements:
-                if 'Rp' in element.text:
-                    price = clean_price(element.text)
+        if price is None and has_price:
+            price_elements = product.select(PRICE_CLASS_SELECTOR)
+            for element_text in [element.get_text() for element in price_elements]:
+                if 'Rp' in element_text:
+                    price = clean_price(element_text)
                     if price:
                         break
         
@@ -200,72 +351,26 @@ def extract_product_data_new_layout(product):
         specs_div = product.find('div', class_='styles_primarySpecsList__4s_rn')
         if not specs_div:
             # Try alternative selectors for specs
-            specs_div = product.find('div', class_=lambda c: c and ('spec' in c.lower() or 'detail' in c.lower()))
-        
-        ram = None
-        storage = None
-        camera = None
-        screen = None
-        battery = None
+            specs_div = product.select_one(SPEC_DIV_SELECTOR)
         
-        if specs_div:
-            # In the new layout, specs are in divs with specific classes
-            spec_items = specs_div.find_all('div', class_=lambda c: c and ('col-md-6' in c or 'spec' in c.lower()))
-            
-            for item in spec_items:
-                spec_text = item.text.strip()
-                
-                # Check for RAM
-                if 'GB' in spec_text and ('RAM' in spec_text.upper() or ram is None):
-                    ram_match = re.search(r'(\d+)\s*GB', spec_text)
-                    if ram_match:
-                        ram = int(ram_match.group(1))
-                
-                # Check for storage
-                if 'GB' in spec_text and ('ROM' in spec_text.upper() or 'STORAGE' in spec_text.upper() or storage is None):
-                    storage_match = re.search(r'(\d+)\s*GB', spec_text)
-                    if storage_match and 'RAM' not in spec_text.upper():  # Make sure it's not RAM
-                        storage = int(storage_match.group(1))
-                
-                # Check for camera
-                if 'MP' in spec_text and camera is None:
-                    camera_match = re.search(r'(\d+)\s*MP', spec_text)
-                    if camera_match:
-                        camera = int(camera_match.group(1))
-                
-                # Check for screen size
-                if 'inch' in spec_text and screen is None:
-                    screen_match = re.search(r'([\d.]+)\s*inch', spec_text)
-                    if screen_match:
-                        screen = float(screen_match.group(1))
-                
-                # Check for battery
-                if 'mAh' in spec_text and battery is None:
-                    battery_match = re.search(r'(\d+)\s*mAh', spec_text)
-                    if battery_match:
-                        battery = int(battery_match.group(1))
+        # In the new layout, specs are in divs with specific classes
+        spec_items = specs_div.select(SPEC_ITEM_SELECTOR) if specs_div else []
+        specs = parse_specs([item.get_text().strip() for item in spec_items])
+        ram = specs['RAM']
+        storage = specs['Storage']
+        camera = specs['Camera']
+        screen = specs['ScreenSize']
+        battery = specs['Battery']
         
         # Extract storage from the name if not found in specs
         if storage is None and 'ROM' in name:
-            storage = extract_spec_value(name, r'ROM\s*(\d+)\s*GB')
+            storage = extract_spec_value(name, ROM_NAME_RE)
         
         # Extract RAM from the name if not found in specs
         if ram is None and 'RAM' in name:
-            ram = extract_spec_value(name, r'RAM\s*(\d+)\s*GB')
-        
-        # Create a dictionary for this phone
-        phone_data = {
-            'Name': name,
-            'Price': price,
-            'RAM': ram,
-            'Storage': storage,
-            'Camera': camera,
-            'ScreenSize': screen,
-            'Battery': battery,
-            'ReleaseYear': release_year
-        }
-        
-        return phone_data
+            ram = extract_spec_value(name, RAM_NAME_RE)
+        
+        return PhoneRecord(name, price, ram, storage, camera, screen, battery, release_year)
     
     except Exception as e:
         logger.error(f"Error extracting product data from new layout: {e}")
@@ -280,12 +385,18 @@ def extract_product_data_old_layout(product):
             # Try alternative selectors for product name
             name_element = product.find('h2')
             if not name_element:
-                name_element = product.find(['h2', 'h3', 'div'], class_=lambda c: c and ('name' in c.lower() or 'title' in c.lower()))
+                name_element = product.find(['h2', 'h3', 'div'], class_=NAME_CLASS_RE)
         
         if not name_element:
             return None
             
-        name = name_element.text.strip()
+        name = name_element.get_text().strip()
+        
+        # Flatten the product's text once for the year fallback and the 'Rp' check
+        product_text = product.get_text(" ", strip=True)
+        # Every price method looks for 'Rp' in some part of the product, so
+        # without it anywhere the element lookups can be skipped
+        has_price = 'Rp' in product_text
         
         # Extract release year
         release_year = None
@@ -294,55 +405,48 @@ def extract_product_data_old_layout(product):
             year_span = year_div.find('span')
             if year_span:
                 try:
-                    release_year = int(year_span.text.strip())
+                    release_year = int(year_span.get_text().strip())
                 except (ValueError, TypeError):
                     pass
         
-        # If year not found in the specific div, try to find it in any text containing a 4-digit year
+        # If year not found in the specific div, take the first 4-digit year in the product text
         if not release_year:
-            year_pattern = r'\b(20\d{2})\b'  # Pattern for years 2000-2099
-            for element in product.find_all(text=True):
-                match = re.search(year_pattern, element.strip())
-                if match:
-                    try:
-                        release_year = int(match.group(1))
-                        break
-                    except (ValueError, TypeError):
-                        pass
+            year_match = YEAR_RE.search(product_text)
+            if year_match:
+                release_year = int(year_match.group(1))
         
         # Extract price - try multiple approaches
         price = None
         
         # Method 1: Look for price in links
-        price_links = product.find_all('a', href=lambda href: href and 'track/seller' in href)
+        price_links = product.select(SELLER_LINK_SELECTOR) if has_price else []
         for link in price_links:
-            price_text = link.text.strip()
+            price_text = link.get_text().strip()
             if 'Rp' in price_text:
                 price = clean_price(price_text)
                 break
         
-        # Method 2: Look for price in any text containing 'Rp'
-        if price is None:
-            for element in product.find_all(text=lambda text: text and 'Rp' in text):
-                price_text = element.strip()
-                price = clean_price(price_text)
+        # Method 2: Look for price in any text node containing 'Rp'
+        if price is None and has_price:
+            for element in product.find_all(string=RP_TEXT_RE):
+                price = clean_price(element.strip())
                 if price:
                     break
         
         # Method 3: Check for table cells that might contain price
-        if price is None:
+        if price is None and has_price:
             td_elements = product.find_all('td')
-            for td in td_elements:
-                if 'Rp' in td.text:
-                    price = clean_price(td.text)
+            for td_text in [td.get_text() for td in td_elements]:
+                if 'Rp' in td_text:
+                    price = clean_price(td_text)
                     break
         
         # Method 4: Look for elements with class containing 'price'
-        if price is None:
-            price_elements = product.find_all(class_=lambda c: c and 'price' in c.lower())
-            for element in price_elements:
-                if 'Rp' in element.text:
-                    price = clean_price(element.text)
+        if price is None and has_price:
+            price_elements = product.select(PRICE_CLASS_SELECTOR)
+            for element_text in [element.get_text() for element in price_elements]:
+                if 'Rp' in element_text:
+                    price = clean_price(element_text)
                     if price:
                         break
         
@@ -350,85 +454,52 @@ def extract_product_data_old_layout(product):
         specs_div = product.find('div', class_='styles_primarySpecsList__4s_rn')
         if not specs_div:
             # Try alternative selectors for specs
-            specs_div = product.find('div', class_=lambda c: c and ('spec' in c.lower() or 'detail' in c.lower()))
+            specs_div = product.select_one(SPEC_DIV_SELECTOR)
         
-        ram = None
-        storage = None
-        camera = None
-        screen = None
-        battery = None
-        
-        if specs_div:
-            spec_items = specs_div.find_all('div', class_=lambda c: c and ('col-md-6' in c or 'spec' in c.lower()))
-            
-            for item in spec_items:
-                spec_text = item.text.strip()
-                
-                if 'GB' in spec_text and ('RAM' in spec_text.upper() or ram is None):
-                    ram = extract_spec_value(spec_text, r'(\d+)\s*GB')
-                
-                if 'GB' in spec_text and ('ROM' in spec_text.upper() or 'STORAGE' in spec_text.upper() or storage is None):
-                    storage_match = re.search(r'(\d+)\s*GB', spec_text)
-                    if storage_match and 'RAM' not in spec_text.upper():  # Make sure it's not RAM
-                        storage = int(storage_match.group(1))
-                
-                if 'MP' in spec_text and camera is None:
-                    camera = extract_spec_value(spec_text, r'(\d+)\s*MP')
-                
-                if 'inch' in spec_text and screen is None:
-                    screen = extract_spec_value(spec_text, r'([\d.]+)\s*inch')
-                
-                if 'mAh' in spec_text and battery is None:
-                    battery = extract_spec_value(spec_text, r'(\d+)\s*mAh')
+        spec_items = specs_div.select(SPEC_ITEM_SELECTOR) if specs_div else []
+        specs = parse_specs([item.get_text().strip() for item in spec_items])
+        ram = specs['RAM']
+        storage = specs['Storage']
+        camera = specs['Camera']
+        screen = specs['ScreenSize']
+        battery = specs['Battery']
         
         # Extract storage from the name if not found in specs
         if storage is None and 'ROM' in name:
-            storage = extract_spec_value(name, r'ROM\s*(\d+)\s*GB')
+            storage = extract_spec_value(name, ROM_NAME_RE)
         
         # Extract RAM from the name if not found in specs
         if ram is None and 'RAM' in name:
-            ram = extract_spec_value(name, r'RAM\s*(\d+)\s*GB')
-        
-        # Create a dictionary for this phone
-        phone_data = {
-            'Name': name,
-            'Price': price,
-            'RAM': ram,
-            'Storage': storage,
-            'Camera': camera,
-            'ScreenSize': screen,
-            'Battery': battery,
-            'ReleaseYear': release_year
-        }
-        
-        return phone_data
+            ram = extract_spec_value(name, RAM_NAME_RE)
+        
+        return PhoneRecord(name, price, ram, storage, camera, screen, battery, release_year)
     
     except Exception as e:
         logger.error(f"Error extracting product data from old layout: {e}")
         return None
 
-def extract_product_data_newest_layout(header_element):
-    """Extract product data from the newest layout (page 269+)"""
+def extract_product_data_newest_layout(header_element, next_element):
+    """Extract product data from the newest layout (page 269+).
+    
+    next_element is the first <a> after the header, which holds the product details.
+    """
     try:
         # The name is in the h2 text
-        name = header_element.text.strip()
+        name = header_element.get_text().strip()
         
         # Extract RAM and ROM from the name
         ram = None
         storage = None
         
-        ram_match = re.search(r'RAM\s*(\d+(?:\.\d+)?)\s*GB', name)
+        ram_match = RAM_NAME_DECIMAL_RE.search(name)
         if ram_match:
             ram_value = ram_match.group(1)
             ram = float(ram_value) if '.' in ram_value else int(ram_value)
         
-        storage_match = re.search(r'ROM\s*(\d+)\s*GB', name)
+        storage_match = ROM_NAME_RE.search(name)
         if storage_match:
             storage = int(storage_match.group(1))
         
-        # Find the next link after this header which contains the product details
-        next_element = header_element.find_next('a')
-        
         price = None
         camera = None
         screen = None
@@ -437,56 +508,68 @@ def extract_product_data_newest_layout(header_element):
         
         if next_element:
             # Extract specs from the link text
-            link_text = next_element.text.strip()
+            link_text = next_element.get_text().strip()
             
             # Try to find price (Rp)
-            price_match = re.search(r'Rp\s*([\d\.]+)', link_text)
+            price_match = PRICE_RE.search(link_text)
             if price_match:
                 price_text = price_match.group(0)
                 price = clean_price(price_text)
             
-            # Extract camera (MP)
-            camera_match = re.search(r'(\d+)\s*MP', link_text)
-            if camera_match:
-                camera = int(camera_match.group(1))
-            
-            # Extract screen size (inch)
-            screen_match = re.search(r'([\d\.]+)\s*inch', link_text)
-            if screen_match:
-                screen = float(screen_match.group(1))
-            
-            # Extract battery (mAh)
-            battery_match = re.search(r'(\d+)\s*mAh', link_text)
-            if battery_match:
-                battery = int(battery_match.group(1))
+            # Extract camera (MP), screen size (inch) and battery (mAh);
+            # RAM and ROM already come from the name
+            found = scan_spec_text(link_text)
+            if 'mp' in found:
+                camera = int(found['mp'])
+            if 'inch' in found:
+                screen = float(found['inch'])
+            if 'mah' in found:
+                battery = int(found['mah'])
             
             # Try to find release year in any text containing a 4-digit year
-            year_pattern = r'\b(20\d{2})\b'  # Pattern for years 2000-2099
-            year_match = re.search(year_pattern, link_text)
+            year_match = YEAR_RE.search(link_text)
             if year_match:
                 release_year = int(year_match.group(1))
         
-        # Create a dictionary for this phone
-        phone_data = {
-            'Name': name,
-            'Price': price,
-            'RAM': ram,
-            'Storage': storage,
-            'Camera': camera,
-            'ScreenSize': screen,
-            'Battery': battery,
-            'ReleaseYear': release_year
-        }
-        
-        return phone_data
+        return PhoneRecord(name, price, ram, storage, camera, screen, battery, release_year)
     
     except Exception as e:
         logger.error(f"Error extracting product data from newest layout: {e}")
         return None
 
-def create_requests_session(max_retries=5, backoff_factor=0.3):
-    """Create a requests session with retry functionality"""
+# Extraction results keyed by (extractor, digest of the product's HTML).
+# Paginated listings repeat product cards, so identical fragments are
+# only parsed once. Worker threads share it; a lost race just repeats work.
+_product_cache = {}
+PRODUCT_CACHE_SIZE = 4096
+
+def extract_product_data_cached(extract_product_data, product):
+    """Run an old/new layout extractor, reusing the result for identical product HTML"""
+    digest = hashlib.blake2b(str(product).encode('utf-8'), digest_size=8).digest()
+    key = (extract_product_data.__name__, digest)
+    
+    phone_data = _product_cache.get(key)
+    if phone_data is None:
+        phone_data = extract_product_data(product)
+        if phone_data is None:
+            return None
+        if len(_product_cache) >= PRODUCT_CACHE_SIZE:
+            _product_cache.clear()
+        _product_cache[key] = phone_data
+    
+    # Records are immutable tuples, so the cached one can be handed out as is
+    return phone_data
+
+def create_requests_session(max_retries=5, backoff_factor=0.3, pool_size=8):
+    """Create a keep-alive requests session with retry functionality and compressed responses"""
     session = requests.Session()
+    # Sent with every request on this session; requests decompresses gzip/deflate
+    # bodies itself ('br' is left out since it needs the optional brotli package)
+    session.headers.update({
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+        'Accept-Encoding': 'gzip, deflate',
+        'Connection': 'keep-alive'
+    })
     retry = Retry(
         total=max_retries,
         read=max_retries,
@@ -494,21 +577,225 @@ def create_requests_session(max_retries=5, backoff_factor=0.3):
         backoff_factor=backoff_factor,
         status_forcelist=[429, 500, 502, 503, 504],
     )
-    adapter = HTTPAdapter(max_retries=retry)
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
     session.mount('http://', adapter)
     session.mount('https://', adapter)
     return session
 
-def scrape_pricebook(url, csv_filename, backup_interval=5, max_retries=5, retry_delay=30, start_page=1, end_page=None):
-    """Scrape smartphone data from Pricebook, saving data after each page"""
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-    }
+class CsvAppender:
+    """Append row tuples (in fieldnames order) to a CSV, buffering them in memory and writing them out in batches.
     
-    # Create a session with retry functionality
-    session = create_requests_session(max_retries=max_retries)
+    The file is only opened (and created, with a header) once there are rows
+    to write, so a scrape that finds nothing leaves no CSV behind.
+    """
+    def __init__(self, csv_filename, fieldnames, flush_rows=100):
+        self.csv_filename = csv_filename
+        self.fieldnames = fieldnames
+        self.flush_rows = flush_rows
+        self.buffer = []
+        self.file = None
+    
+    def __enter__(self):
+        return self
+    
+    def _open(self):
+        self.file = open(self.csv_filename, 'a', newline='', encoding='utf-8')
+        self.writer = csv.writer(self.file)
+        if os.path.getsize(self.csv_filename) == 0:
+            self.writer.writerow(self.fieldnames)
+    
+    def write_rows(self, rows):
+        """Queue rows, writing the buffer out once it holds flush_rows rows"""
+        self.buffer.extend(rows)
+        if len(self.buffer) >= self.flush_rows:
+            self.flush()
+    
+    def flush(self):
+        """Write any buffered rows and flush the file to disk"""
+        if self.buffer:
+            if self.file is None:
+                self._open()
+            self.writer.writerows(self.buffer)
+            logger.info(f"Wrote {len(self.buffer)} rows to {self.csv_filename}")
+            self.buffer.clear()
+        if self.file is not None:
+            self.file.flush()
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        # Runs on normal exit, errors and Ctrl+C alike, so buffered rows are never lost
+        self.flush()
+        if self.file is not None:
+            self.file.close()
+        return False
+
+class RateLimiter:
+    """Space request start times at least min_interval seconds apart across threads"""
+    def __init__(self, min_interval):
+        self.min_interval = min_interval
+        self._next_slot = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def wait(self):
+        """Block until the caller's request slot comes up"""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.min_interval
+        if slot > now:
+            time.sleep(slot - now)
+
+# One session per worker thread, so each keeps its own connection pool
+_thread_local = threading.local()
+
+def get_thread_session(max_retries=5):
+    """Get the calling thread's requests session, creating it on first use"""
+    session = getattr(_thread_local, 'session', None)
+    if session is None:
+        session = create_requests_session(max_retries=max_retries)
+        _thread_local.session = session
+    return session
+
+def fetch_page(page_url, page, rate_limiter, max_retries=5, retry_delay=30):
+    """Fetch a single page's body with retries, returning None if every attempt fails"""
+    session = get_thread_session(max_retries=max_retries)
+    
+    for attempt in range(1, max_retries + 1):
+        rate_limiter.wait()
+        try:
+            # The body is read inside the retry loop, so a connection dropped
+            # midway through it is retried like any other request error
+            response = session.get(page_url, timeout=30)
+            response.raise_for_status()  # Raise exception for HTTP errors
+            return response.content
+        except requests.exceptions.RequestException as e:
+            if attempt < max_retries:
+                wait_time = retry_delay * attempt
+                logger.warning(f"Error accessing page {page}: {e}")
+                logger.info(f"Retrying in {wait_time} seconds... (Attempt {attempt}/{max_retries})")
+                time.sleep(wait_time)
+            else:
+                logger.error(f"Failed to access page {page} after {max_retries} attempts: {e}")
+    
+    return None
+
+def parse_page(markup, page):
+    """Parse a page's HTML and extract its phones, returning (layout_type, phones).
+    
+    phones is None when no product containers were found on an old/new layout page.
+    """
+    soup = BeautifulSoup(markup, 'lxml', parse_only=PAGE_STRAINER)
+    
+    # Detect layout type; the page number is usually enough once its container is confirmed
+    layout_type = detect_layout(soup, page)
+    logger.info(f"Detected layout type for page {page}: {layout_type}")
+    phones = extract_phones(soup, layout_type)
+    
+    # If the cheap guess found nothing, probe the DOM for the actual layout
+    if not phones:
+        probed_layout = probe_layout(soup, page)
+        if probed_layout != layout_type:
+            logger.info(f"No phones found as {layout_type} layout on page {page}, retrying as {probed_layout}")
+            layout_type = probed_layout
+            phones = extract_phones(soup, layout_type)
+    
+    return layout_type, phones
+
+def extract_phones(soup, layout_type):
+    """Extract phone data from a parsed page using the given layout.
+    
+    Returns None when no product containers were found on an old/new layout page.
+    """
+    phones = []
+    
+    # Handle different layout types
+    if layout_type == "newest":
+        # For the newest layout (page 269+), each h2 header with a phone name is
+        # followed by a link with its details. Pair them in one pass over the
+        # document instead of a find_next('a') walk per header.
+        pairs = []
+        waiting = []
+        for element in soup.descendants:
+            if element.name == 'h2':
+                header_text = element.get_text()
+                if "RAM" in header_text and "ROM" in header_text:
+                    waiting.append(element)
+            elif element.name == 'a' and waiting:
+                pairs.extend((header, element) for header in waiting)
+                waiting.clear()
+        # Headers with no link after them still yield a name-only record
+        pairs.extend((header, None) for header in waiting)
+        
+        for header, link in pairs:
+            try:
+                phone_data = extract_product_data_newest_layout(header, link)
+                if phone_data and phone_data.Name:
+                    phones.append(phone_data)
+            except Exception as e:
+                logger.error(f"Error processing a product in newest layout: {e}")
+        return phones
+    
+    # Find products based on layout type
+    products = []
+    
+    if layout_type == "old":
+        # Try old layout selectors
+        products = soup.find_all('div', class_='styles_productPanel__Tlvp6')
+        
+        # If no products found, try alternative old layout
+        if not products:
+            products = soup.find_all('div', class_='row')
+    else:  # new layout
+        # Try new layout selectors
+        products = soup.select('div.styles_productPanel__Tlvp6')
+        
+        # If still no products, try other selectors for the new layout
+        if not products:
+            products = soup.select('div[class*="productPanel"]')
+        
+        # If still no products, try to find any div that might contain product info
+        if not products:
+            # Look for divs that contain product information
+            potential_products = soup.find_all('div', class_=PRODUCT_ITEM_CLASS_RE)
+            if potential_products:
+                products = potential_products
+    
+    # Last resort: try to find any div that might be a product container
+    if not products:
+        # Look for divs with common product container classes or attributes
+        products = soup.find_all('div', class_=PRODUCT_CLASS_RE)
+    
+    if not products:
+        return None
+    
+    # Extract data based on the layout
+    extract_product_data = extract_product_data_new_layout if layout_type == "new" else extract_product_data_old_layout
+    
+    for product in products:
+        try:
+            phone_data = extract_product_data_cached(extract_product_data, product)
+            if phone_data and phone_data.Name:
+                phones.append(phone_data)
+        except Exception as e:
+            logger.error(f"Error processing a product: {e}")
+            continue  # Continue with the next product
+    
+    return phones
+
+def scrape_page(page_url, page, rate_limiter, max_retries=5, retry_delay=30):
+    """Fetch and parse one page; runs on a worker thread"""
+    logger.info(f"Scraping page {page}: {page_url}")
+    content = fetch_page(page_url, page, rate_limiter, max_retries=max_retries, retry_delay=retry_delay)
+    if content is None:
+        return None
+    
+    return parse_page(content, page)
+
+def scrape_pricebook(url, csv_filename, backup_interval=5, max_retries=5, retry_delay=30, start_page=1, end_page=None,
+                     workers=4, request_interval=1.0, flush_rows=100):
+    """Scrape smartphone data from Pricebook, saving data in batches of flush_rows rows"""
+    # Shared across workers to keep the overall request rate polite
+    rate_limiter = RateLimiter(request_interval)
     
-    page = start_page
     total_phones = 0
     empty_pages_count = 0
     max_empty_pages = 3  # Stop after 3 consecutive empty pages
@@ -521,173 +808,170 @@ def scrape_pricebook(url, csv_filename, backup_interval=5, max_retries=5, retry_
     existing_phones = get_existing_phones(csv_filename)
     logger.info(f"Found {len(existing_phones)} existing phones in the CSV")
     
-    while end_page is None or page <= end_page:
-        page_url = f"{url}?page={page}" if page > 1 else url
-        logger.info(f"Scraping page {page}: {page_url}")
-        
-        retry_count = 0
-        success = False
-        
-        while not success and retry_count < max_retries:
-            try:
-                response = session.get(page_url, headers=headers, timeout=30)
-                response.raise_for_status()  # Raise exception for HTTP errors
-                success = True
-            except requests.exceptions.RequestException as e:
-                retry_count += 1
-                if retry_count < max_retries:
-                    wait_time = retry_delay * retry_count
-                    logger.warning(f"Error accessing page {page}: {e}")
-                    logger.info(f"Retrying in {wait_time} seconds... (Attempt {retry_count}/{max_retries})")
-                    time.sleep(wait_time)
-                else:
-                    logger.error(f"Failed to access page {page} after {max_retries} attempts: {e}")
-                    # Don't break the entire loop, just move to the next page
-                    page += 1
-                    continue
-        
-        if not success:
-            continue
-        
-        try:
-            soup = BeautifulSoup(response.content, 'html.parser')
+    # Pages are fetched and parsed concurrently, but consumed here strictly in
+    # page order, so duplicate handling, CSV appends and the empty-page stop
+    # rule behave exactly as in a sequential scrape
+    pending = deque()
+    next_page = start_page
+    
+    # The CSV stays open in append mode for the whole scrape; rows are buffered
+    # and written every flush_rows rows, before each backup and on exit
+    with CsvAppender(csv_filename, CSV_FIELDNAMES, flush_rows=flush_rows) as csv_out, \
+            ThreadPoolExecutor(max_workers=workers) as executor:
+        while True:
+            # Keep up to `workers` pages in flight ahead of the one being consumed
+            while len(pending) < workers and (end_page is None or next_page <= end_page):
+                page_url = f"{url}?page={next_page}" if next_page > 1 else url
+                future = executor.submit(scrape_page, page_url, next_page, rate_limiter,
+                                         max_retries=max_retries, retry_delay=retry_delay)
+                pending.append((next_page, future))
+                next_page += 1
             
-            # Detect layout type
-            layout_type = detect_layout(soup, page)
-            logger.info(f"Detected layout type for page {page}: {layout_type}")
+            if not pending:
+                break
             
-            # List to store data from this page
-            page_phones = []
+            page, future = pending.popleft()
             
-            # Handle different layout types
-            if layout_type == "newest":
-                # For the newest layout (page 269+), find all h2 headers with phone names
-                h2_headers = soup.find_all('h2')
-                
-                for header in h2_headers:
-                    if "RAM" in header.text and "ROM" in header.text:
-                        try:
-                            phone_data = extract_product_data_newest_layout(header)
-                            
-                            if not phone_data or not phone_data['Name']:
-                                continue
-                            
-                            # Skip if this phone is already in our dataset
-                            if phone_data['Name'] in existing_phones:
-                                logger.info(f"Skipping duplicate: {phone_data['Name']}")
-                                continue
-                            
-                            # Add the phone even if price is None, we'll filter later if needed
-                            page_phones.append(phone_data)
-                            existing_phones.add(phone_data['Name'])  # Add to our tracking set
-                            logger.info(f"Scraped: {phone_data['Name']} - RAM: {phone_data['RAM']} - Storage: {phone_data['Storage']}")
-                            
-                        except Exception as e:
-                            logger.error(f"Error processing a product in newest layout: {e}")
-                            continue
-            else:
-                # Find products based on layout type
-                products = []
-                
-                if layout_type == "old":
-                    # Try old layout selectors
-                    products = soup.find_all('div', class_='styles_productPanel__Tlvp6')
-                    
-                    # If no products found, try alternative old layout
-                    if not products:
-                        products = soup.find_all('div', class_='row')
-                else:  # new layout
-                    # Try new layout selectors
-                    products = soup.select('div.styles_productPanel__Tlvp6')
-                    
-                    # If still no products, try other selectors for the new layout
-                    if not products:
-                        products = soup.select('div[class*="productPanel"]')
-                    
-                    # If still no products, try to find any div that might contain product info
-                    if not products:
-                        # Look for divs that contain product information
-                        potential_products = soup.find_all('div', class_=lambda c: c and ('product' in c.lower() or 'item' in c.lower()))
-                        if potential_products:
-                            products = potential_products
+            try:
+                result = future.result()
+                if result is None:
+                    # Don't stop the entire scrape, just move to the next page
+                    continue
                 
-                # Last resort: try to find any div that might be a product container
-                if not products:
-                    # Look for divs with common product container classes or attributes
-                    products = soup.find_all('div', class_=lambda c: c and any(term in c.lower() for term in ['product', 'item', 'card', 'listing']))
+                layout_type, phones = result
                 
-                if not products or len(products) == 0:
+                if phones is None:
                     logger.warning(f"No products found on page {page}")
                     empty_pages_count += 1
                     if empty_pages_count >= max_empty_pages:
                         logger.info(f"Reached {max_empty_pages} consecutive empty pages. Stopping scraping.")
                         break
-                    page += 1
                     continue
                 
                 # Reset empty pages counter since we found products
-                empty_pages_count = 0
+                if layout_type != "newest":
+                    empty_pages_count = 0
                 
-                for product in products:
-                    try:
-                        # Extract data based on the layout
-                        if layout_type == "new":
-                            phone_data = extract_product_data_new_layout(product)
-                        else:
-                            phone_data = extract_product_data_old_layout(product)
-                        
-                        if not phone_data or not phone_data['Name']:
-                            continue
-                        
-                        # Skip if this phone is already in our dataset
-                        if phone_data['Name'] in existing_phones:
-                            logger.info(f"Skipping duplicate: {phone_data['Name']}")
-                            continue
-                        
-                        if phone_data['Price'] is not None:  # Only add phones with valid prices
-                            page_phones.append(phone_data)
-                            existing_phones.add(phone_data['Name'])  # Add to our tracking set
-                            logger.info(f"Scraped: {phone_data['Name']} - Price: {phone_data['Price']} - Year: {phone_data['ReleaseYear']}")
-                        
-                    except Exception as e:
-                        logger.error(f"Error processing a product: {e}")
-                        continue  # Continue with the next product
-            
-            # Save data from this page to CSV
-            if page_phones:
-                # Always append if the file exists
-                append_mode = os.path.exists(csv_filename)
-                save_data_to_csv(page_phones, csv_filename, append=append_mode)
-                total_phones += len(page_phones)
+                # List to store data from this page
+                page_phones = []
                 
-                # Create backup at specified intervals
-                if page % backup_interval == 0:
-                    create_backup(csv_filename)
-            else:
-                logger.warning(f"No phones extracted from page {page}")
-                empty_pages_count += 1
-                if empty_pages_count >= max_empty_pages:
-                    logger.info(f"Reached {max_empty_pages} consecutive empty pages with no data. Stopping scraping.")
-                    break
-            
-            # Add a random delay between requests to be respectful to the server
-            delay = random.uniform(1, 3)
-            logger.info(f"Waiting {delay:.2f} seconds before next request...")
-            time.sleep(delay)
-            
-            # Move to next page
-            page += 1
-            
-        except Exception as e:
-            logger.error(f"Error processing page {page}: {e}")
-            # Create a backup in case of unexpected error
-            if os.path.exists(csv_filename):
+                for phone_data in phones:
+                    # Skip if this phone is already in our dataset
+                    name_key = phone_key(phone_data.Name)
+                    if name_key in existing_phones:
+                        logger.info("Skipping duplicate: %s", phone_data.Name)
+                        continue
+                    
+                    if layout_type == "newest":
+                        # Add the phone even if price is None, we'll filter later if needed
+                        page_phones.append(phone_data)
+                        existing_phones.add(name_key)  # Add to our tracking set
+                        logger.info("Scraped: %s - RAM: %s - Storage: %s", phone_data.Name, phone_data.RAM, phone_data.Storage)
+                    elif phone_data.Price is not None:  # Only add phones with valid prices
+                        page_phones.append(phone_data)
+                        existing_phones.add(name_key)  # Add to our tracking set
+                        logger.info("Scraped: %s - Price: %s - Year: %s", phone_data.Name, phone_data.Price, phone_data.ReleaseYear)
+                
+                # Save data from this page to CSV
+                if page_phones:
+                    csv_out.write_rows(page_phones)
+                    total_phones += len(page_phones)
+                    
+                    # Create backup at specified intervals
+                    if page % backup_interval == 0:
+                        csv_out.flush()
+                        create_backup(csv_filename)
+                else:
+                    logger.warning(f"No phones extracted from page {page}")
+                    empty_pages_count += 1
+                    if empty_pages_count >= max_empty_pages:
+                        logger.info(f"Reached {max_empty_pages} consecutive empty pages with no data. Stopping scraping.")
+                        break
+                
+            except Exception as e:
+                logger.error(f"Error processing page {page}: {e}")
+                # Create a backup in case of unexpected error
+                csv_out.flush()
                 create_backup(csv_filename)
-            # Don't break, just move to the next page
-            page += 1
+                # Don't break, just move to the next page
+        
+        # Drop pages queued past the point where scraping stopped
+        for _, future in pending:
+            future.cancel()
     
     return total_phones
 
+def load_scraped_data(csv_filename):
+    """Load the scraped CSV into a DataFrame with Arrow-backed columns when pyarrow is available"""
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pacsv
+    except ImportError:
+        return pd.read_csv(csv_filename, dtype=CSV_DTYPES)
+    
+    # Earlier runs (and pandas) wrote integers as '1171000.0', which pyarrow's
+    # integer parser rejects, so parse the numbers as float64 and cast after;
+    # the cast is checked and fails only on a genuinely fractional value
+    read_types = {column: pa.float64() for column in ARROW_COLUMN_TYPES}
+    convert_options = pacsv.ConvertOptions(column_types=read_types)
+    try:
+        table = pacsv.read_csv(csv_filename, convert_options=convert_options)
+        target_schema = pa.schema([
+            pa.field(field.name, pa.type_for_alias(ARROW_COLUMN_TYPES[field.name]))
+            if field.name in ARROW_COLUMN_TYPES else field
+            for field in table.schema
+        ])
+        table = table.cast(target_schema)
+    except pa.ArrowInvalid as e:
+        logger.warning(f"pyarrow could not parse {csv_filename} ({e}), falling back to pandas")
+        # Still hand back Arrow-backed columns so the summary runs on the same dtypes
+        df = pd.read_csv(csv_filename, dtype=CSV_DTYPES)
+        return df.convert_dtypes(dtype_backend='pyarrow')
+    
+    return table.to_pandas(types_mapper=pd.ArrowDtype)
+
+def summarize(df):
+    """Describe the numeric columns and count missing values per column, returning (desc, nulls).
+    
+    Runs a fused numba kernel over each numeric column; the table matches
+    df.describe() (linear-interpolated quartiles).
+    """
+    import numpy as np
+    from stats_kernels import column_stats
+    
+    # One kernel pass per numeric column yields describe()'s moments and the
+    # null count together; only the quartiles need a separate (sorting) pass
+    stats = {}
+    nulls = {}
+    numeric_columns = [column for column in df.columns if pd.api.types.is_numeric_dtype(df[column])]
+    for column in numeric_columns:
+        values = df[column].to_numpy(dtype=np.float64, na_value=np.nan)
+        count, mean, std, col_min, col_max, nan_count = column_stats(values)
+        quartiles = np.nanpercentile(values, [25, 50, 75]) if count else [np.nan] * 3
+        stats[column] = [count, mean, std, col_min, *quartiles, col_max]
+        nulls[column] = nan_count
+    desc = pd.DataFrame(stats, index=['count', 'mean', 'std', 'min', '25%', '50%', '75%', 'max'])
+    
+    # Only the remaining (text) columns need their own null scan
+    for column in df.columns.difference(desc.columns, sort=False):
+        nulls[column] = df[column].isnull().sum()
+    
+    return desc, pd.Series(nulls).reindex(df.columns).astype('int64')
+
+def save_summary_tables(tables, prefix):
+    """Write each summary table to <prefix>_<name>.parquet, returning the paths written (none without pyarrow)"""
+    try:
+        import pyarrow  # noqa: F401 - pandas' parquet engine
+    except ImportError:
+        return []
+    
+    paths = []
+    for name, table in tables.items():
+        path = f"{prefix}_{name}.parquet"
+        table.to_parquet(path)
+        paths.append(path)
+    return paths
+
 def main():
     # URL of the Pricebook smartphone page
     url = 'https://www.pricebook.co.id/smartphone'
@@ -703,6 +987,8 @@ def main():
     parser.add_argument('--backup-interval', type=int, default=5, help='Create backup every N pages')
     parser.add_argument('--max-retries', type=int, default=5, help='Maximum number of retries for failed requests')
     parser.add_argument('--retry-delay', type=int, default=30, help='Base delay between retries in seconds')
+    parser.add_argument('--workers', type=int, default=4, help='Number of pages to fetch concurrently')
+    parser.add_argument('--request-interval', type=float, default=1.0, help='Minimum seconds between request starts across all workers')
     
     args = parser.parse_args()
     
@@ -717,39 +1003,59 @@ def main():
         max_retries=args.max_retries,
         retry_delay=args.retry_delay,
         start_page=args.start_page,
-        end_page=args.end_page
+        end_page=args.end_page,
+        workers=args.workers,
+        request_interval=args.request_interval
     )
     
     # Load the final dataset
     if os.path.exists(csv_filename):
-        df = pd.read_csv(csv_filename)
+        df = load_scraped_data(csv_filename)
+        summary_file = "scraping_summary.txt"
+        timestamp = time.strftime('%Y-%m-%d %H:%M:%S')
+        header = f"Scraping Summary - {timestamp}\nTotal smartphones collected: {len(df)}\n\n"
         
-        # Display summary
-        logger.info(f"\nTotal smartphones collected: {len(df)}")
-        logger.info("\nSample data:")
-        logger.info(df.head())
+        if len(df) < SMALL_SUMMARY_ROWS:
+            rows_text = df.to_csv(sep='\t', index=False, float_format=SUMMARY_FLOAT_FORMAT)
+            Path(summary_file).write_text(f"{header}Scraped data:\n{rows_text}", encoding='utf-8')
+            logger.info(f"\nTotal smartphones collected: {len(df)}; rows written to {summary_file}")
+            return
         
-        # Basic statistics
-        logger.info("\nBasic statistics:")
-        logger.info(df.describe())
+        # Compute and format each table once; the log and the report share them.
+        # Tab-separated text goes through pandas' C CSV writer instead of the
+        # column-aligning to_string formatter, and loads straight back with read_csv.
+        # float_format keeps float32 columns (RAM, ScreenSize) from printing as 6.670000076293945
+        head_text = df.head().to_csv(sep='\t', index=False, float_format=SUMMARY_FLOAT_FORMAT)
+        desc, nulls = summarize(df)
+        desc_text = desc.to_csv(sep='\t', float_format=SUMMARY_FLOAT_FORMAT)
+        nulls_text = nulls.to_csv(sep='\t', header=False)
         
-        # Count missing values
-        logger.info("\nMissing values per column:")
-        logger.info(df.isnull().sum())
+        # Display a short summary; the full tables go to the report file and
+        # are only echoed to the log at DEBUG level
+        logger.info(f"\nTotal smartphones collected: {len(df)} rows, {df.shape[1]} columns")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("\nSample data:\n%s", head_text)
+            logger.debug("\nBasic statistics:\n%s", desc_text)
+            logger.debug("\nMissing values per column:\n%s", nulls_text)
         
-        # Save a summary report
-        summary_file = "scraping_summary.txt"
-        with open(summary_file, 'w') as f:
-            f.write(f"Scraping Summary - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write(f"Total smartphones collected: {len(df)}\n\n")
-            f.write("Sample data:\n")
-            f.write(df.head().to_string() + "\n\n")
-            f.write("Basic statistics:\n")
-            f.write(df.describe().to_string() + "\n\n")
-            f.write("Missing values per column:\n")
-            f.write(df.isnull().sum().to_string() + "\n")
-        
-        logger.info(f"Summary report saved to {summary_file}")
+        # Save a summary report. The 1 MiB buffer holds the whole report, so the
+        # sections reach the disk in a single write when the file is closed,
+        # without first being joined into one more string.
+        parts = [
+            header,
+            f"Sample data:\n{head_text}\n",
+            f"Basic statistics:\n{desc_text}\n",
+            f"Missing values per column:\n{nulls_text}"
+        ]
+        with open(summary_file, 'w', encoding='utf-8', buffering=SUMMARY_BUFFER_SIZE) as f:
+            f.writelines(parts)
+        
+        logger.info(f"Sample data, statistics and missing values written to {summary_file}")
+        
+        # Also keep the tables in columnar form, typed and ready for other tools
+        summary_tables = {'head': df.head(), 'stats': desc, 'missing': nulls.to_frame('missing')}
+        for path in save_summary_tables(summary_tables, "scraping_summary"):
+            logger.info(f"Summary table saved to {path}")
     else:
         logger.error("No data was scraped. Check the website structure or connection.")
 